@@ -6,15 +6,21 @@ Resizes images to optimal sizes for 800x800 display
 
 import os
 import sys
+import hashlib
 from PIL import Image
+import numpy as np
 import struct
 
-def rgb565_from_rgb888(r, g, b):
-    """Convert RGB888 to RGB565"""
-    r = (r >> 3) & 0x1F
-    g = (g >> 2) & 0x3F  
-    b = (b >> 3) & 0x1F
-    return (r << 11) | (g << 5) | b
+# Precomputed byte -> "0x.." token table shared by every conversion
+_HEX_TOKENS = ["0x%02x" % b for b in range(256)]
+
+def output_up_to_date(c_path, marker):
+    """Check whether the existing C file already carries this content marker"""
+    try:
+        with open(c_path, 'r') as f:
+            return marker in f.read(256)
+    except OSError:
+        return False
 
 def convert_png_to_lvgl_c(png_path, output_path, target_width, target_height):
     """Convert PNG to LVGL C array format"""
@@ -30,19 +36,13 @@ def convert_png_to_lvgl_c(png_path, output_path, target_width, target_height):
     # Resize with high-quality resampling
     img = img.resize((target_width, target_height), Image.Resampling.LANCZOS)
     
-    # Get image data
-    pixels = list(img.getdata())
-    
-    # Convert to RGB565 with alpha
-    rgb565_data = []
-    alpha_data = []
-    
-    for r, g, b, a in pixels:
-        # Convert RGB to RGB565
-        rgb565 = rgb565_from_rgb888(r, g, b)
-        rgb565_data.append(rgb565)
-        alpha_data.append(a)
-    
+    # Convert to RGB565 in one vectorized pass (no per-pixel tuples)
+    arr = np.asarray(img.convert('RGB'), dtype=np.uint8)
+    rgb565 = (((arr[..., 0].astype(np.uint16) & 0xF8) << 8) |
+              ((arr[..., 1].astype(np.uint16) & 0xFC) << 3) |
+              (arr[..., 2] >> 3))
+    raw = rgb565.astype('<u2').tobytes()
+
     # Generate C file
     img_name = os.path.splitext(os.path.basename(png_path))[0].lower()
     var_name = f"howdy_img_{img_name}"
@@ -65,21 +65,24 @@ extern const lv_img_dsc_t {var_name};
 #endif
 """
     
-    c_content = f"""/* Auto-generated LVGL image data from {os.path.basename(png_path)} */
+    # Skip the write (and downstream C recompiles) if the rendered content
+    # is already on disk
+    content_marker = f"/* blake2b={hashlib.blake2b(raw, digest_size=16).hexdigest()} */"
+    c_path = os.path.join(output_path, f"{var_name}.c")
+    if output_up_to_date(c_path, content_marker):
+        print(f"Up to date: {c_path}")
+        return var_name
+
+    c_prologue = f"""/* Auto-generated LVGL image data from {os.path.basename(png_path)} */
 /* Original size: {original_size[0]}x{original_size[1]}, Target: {target_width}x{target_height} */
+{content_marker}
 
 #include "lvgl.h"
 
 static const uint8_t {var_name}_map[] = {{
 """
-    
-    # Add RGB565 data (2 bytes per pixel)
-    for i, rgb565 in enumerate(rgb565_data):
-        if i % 8 == 0:
-            c_content += "\n    "
-        c_content += f"0x{rgb565 & 0xFF:02x}, 0x{(rgb565 >> 8) & 0xFF:02x}, "
-    
-    c_content += f"""
+
+    c_epilogue = f"""
 }};
 
 const lv_img_dsc_t {var_name} = {{
@@ -88,20 +91,25 @@ const lv_img_dsc_t {var_name} = {{
     .header.reserved = 0,
     .header.w = {target_width},
     .header.h = {target_height},
-    .data_size = {len(rgb565_data) * 2},
+    .data_size = {len(raw)},
     .data = {var_name}_map,
 }};
 """
-    
+
     # Write files
     header_path = os.path.join(output_path, f"{var_name}.h")
-    c_path = os.path.join(output_path, f"{var_name}.c")
-    
+
     with open(header_path, 'w') as f:
         f.write(header_content)
-    
+
+    # Stream the RGB565 data (2 bytes per pixel, 16 bytes per line) straight
+    # to the file; bytes.hex() + str.join keeps all formatting in C code
+    tokens = [_HEX_TOKENS[b] for b in raw]
     with open(c_path, 'w') as f:
-        f.write(c_content)
+        f.write(c_prologue)
+        for i in range(0, len(tokens), 16):
+            f.write("\n    " + ", ".join(tokens[i:i + 16]) + ",")
+        f.write(c_epilogue)
     
     print(f"Converted {png_path} -> {header_path}, {c_path}")
     print(f"  Size: {original_size[0]}x{original_size[1]} -> {target_width}x{target_height}")
@@ -6,9 +6,22 @@ Optimized for embedded systems with memory constraints
 
 import os
 import sys
+import hashlib
 from PIL import Image
+import numpy as np
 import argparse
 
+# Precomputed byte -> "0x.." token table shared by every conversion
+_HEX_TOKENS = ["0x%02X" % b for b in range(256)]
+
+def output_up_to_date(c_path, marker):
+    """Check whether the existing C file already carries this content marker"""
+    try:
+        with open(c_path, 'r') as f:
+            return marker in f.read(256)
+    except OSError:
+        return False
+
 def convert_png_to_lvgl_c_array(image_path, output_path, var_name, max_width=128, max_height=128):
     """
     Convert PNG image to LVGL C array format
@@ -57,47 +70,43 @@ extern const lv_img_dsc_t {var_name};
 #endif
 """
         
-        # Generate C source content
-        c_content = f"""/* Auto-generated LVGL image data from {os.path.basename(image_path)} */
+        # Handle transparency - composite over black in PIL's C path so the
+        # rest of the conversion is pure uint8 bitshifts with no alpha math
+        bg = Image.new('RGBA', img.size, (0, 0, 0, 255))
+        img = Image.alpha_composite(bg, img).convert('RGB')
+
+        # Convert pixels to RGB565 format (vectorized - one pass over the whole image)
+        rgb = np.asarray(img, dtype=np.uint8)
+
+        # Convert to RGB565 (16-bit: 5R + 6G + 5B)
+        r565 = (rgb[..., 0] >> 3).astype(np.uint16)
+        g565 = (rgb[..., 1] >> 2).astype(np.uint16)
+        b565 = (rgb[..., 2] >> 3).astype(np.uint16)
+
+        rgb565 = (r565 << 11) | (g565 << 5) | b565
+
+        # Store as little-endian bytes
+        pixel_data = rgb565.astype('<u2').tobytes()
+
+        # Skip the write (and downstream C recompiles) if the rendered
+        # content is already on disk
+        content_marker = f"/* blake2b={hashlib.blake2b(pixel_data, digest_size=16).hexdigest()} */"
+        if output_up_to_date(output_path, content_marker):
+            print(f"Up to date: {output_path}")
+            return True
+
+        # Generate C source prologue
+        c_prologue = f"""/* Auto-generated LVGL image data from {os.path.basename(image_path)} */
 /* Original size: {original_size[0]}x{original_size[1]}, Scaled: {width}x{height} */
+{content_marker}
 
 #include "{var_name}.h"
 
 /* Image data in RGB565 format */
 static const uint8_t {var_name}_data[] = {{
 """
-        
-        # Convert pixels to RGB565 format
-        pixel_data = []
-        for y in range(height):
-            for x in range(width):
-                r, g, b, a = img.getpixel((x, y))
-                
-                # Handle transparency - blend with black background
-                if a < 255:
-                    alpha = a / 255.0
-                    r = int(r * alpha)
-                    g = int(g * alpha) 
-                    b = int(b * alpha)
-                
-                # Convert to RGB565 (16-bit: 5R + 6G + 5B)
-                r565 = (r >> 3) & 0x1F
-                g565 = (g >> 2) & 0x3F  
-                b565 = (b >> 3) & 0x1F
-                
-                rgb565 = (r565 << 11) | (g565 << 5) | b565
-                
-                # Store as little-endian bytes
-                pixel_data.append(rgb565 & 0xFF)
-                pixel_data.append((rgb565 >> 8) & 0xFF)
-        
-        # Format pixel data as C array
-        for i, byte in enumerate(pixel_data):
-            if i % 16 == 0:
-                c_content += "\n    "
-            c_content += f"0x{byte:02X}, "
-        
-        c_content += f"""
+
+        c_epilogue = f"""
 }};
 
 /* LVGL image descriptor */
@@ -111,15 +120,20 @@ const lv_img_dsc_t {var_name} = {{
     .data = {var_name}_data,
 }};
 """
-        
+
         # Write header file
         header_path = output_path.replace('.c', '.h')
         with open(header_path, 'w') as f:
             f.write(header_content)
-        
-        # Write C source file
+
+        # Write C source file, streaming the pixel table 16 bytes per line
+        # so memory stays flat regardless of image size
+        tokens = [_HEX_TOKENS[b] for b in pixel_data]
         with open(output_path, 'w') as f:
-            f.write(c_content)
+            f.write(c_prologue)
+            for i in range(0, len(tokens), 16):
+                f.write("\n    " + ", ".join(tokens[i:i + 16]) + ",")
+            f.write(c_epilogue)
             
         print(f"Generated: {header_path} and {output_path}")
         print(f"Image size: {width}x{height}, Data size: {len(pixel_data)} bytes")
@@ -17,6 +17,8 @@ Usage:
 """
 
 import asyncio
+import heapq
+import itertools
 import json
 import logging
 import argparse
@@ -24,7 +26,7 @@ import signal
 import sys
 import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 # Third-party imports
 try:
@@ -33,13 +35,26 @@ try:
     from aiohttp import web, WSMsgType
     from aiohttp.web_ws import WebSocketResponse
     import aiohttp_cors
-    from zeroconf import ServiceInfo, Zeroconf
+    from zeroconf import ServiceInfo
+    from zeroconf.asyncio import AsyncZeroconf
     import psutil
 except ImportError as e:
     print(f"Missing required dependency: {e}")
     print("Install with: pip3 install websockets aiohttp aiohttp-cors zeroconf psutil")
     sys.exit(1)
 
+# orjson is optional but serializes several times faster than stdlib json
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -47,6 +62,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger('HowdyTTS-TestServer')
 
+# 1KB of silence sent after every mock TTS response
+MOCK_AUDIO_SILENCE = b'\x00' * 1024
+
+def append_varint(buf: bytearray, n: int):
+    """Append n as a 7-bit-per-byte varint with MSB continuation"""
+    while n > 0x7F:
+        buf.append((n & 0x7F) | 0x80)
+        n >>= 7
+    buf.append(n)
+
+def fast_json_response(data, status: int = 200) -> web.Response:
+    """web.json_response equivalent backed by the fast serializer"""
+    return web.Response(text=json_dumps(data), status=status,
+                        content_type='application/json')
+
 class HowdyTTSTestServer:
     """HowdyTTS Test Server for ESP32-P4 development and testing"""
     
@@ -54,11 +84,36 @@ class HowdyTTSTestServer:
         self.port = port
         self.name = name
         self.start_time = time.time()
+
+        # Prime the non-blocking CPU counter so later interval=None calls
+        # return the delta since the previous sample
+        psutil.cpu_percent(interval=None)
+
+        # Cached system stats maintained by the background sampler task
+        self._cpu_percent = 0.0
+        self._memory_percent = psutil.virtual_memory().percent
+        self._stats_task = None
+
+        # Running event loop, cached by start()
+        self._loop = None
+
+        # Set when shutdown is requested - waiters cost nothing until then
+        self._stop_event = asyncio.Event()
+
+        # Simulated TTS responses pending their processing deadline, flushed
+        # by a single dispatcher task instead of one sleeping task per request
+        self._pending_tts: list = []
+        self._tts_seq = itertools.count()
+        self._tts_pending_event = asyncio.Event()
+        self._tts_task = None
         
         # Server state
         self.registered_devices: Dict[str, dict] = {}
         self.active_sessions: List[dict] = []
-        self.websocket_clients: List[WebSocketResponse] = []
+        self.websocket_clients: Set[WebSocketResponse] = set()
+
+        # Serialized /devices payload, invalidated whenever the registry changes
+        self._devices_json: Optional[str] = None
         
         # mDNS service
         self.zeroconf = None
@@ -68,7 +123,44 @@ class HowdyTTSTestServer:
         self.app = None
         self.runner = None
         self.site = None
-        
+
+        # Pre-built payloads - the config response is fully static per process
+        # and the welcome message only varies in session_id/timestamp
+        self._config_json = json_dumps({
+            "server_name": self.name,
+            "version": "1.0.0-test",
+            "features": {
+                "text_to_speech": True,
+                "voice_recognition": True,
+                "websocket_streaming": True,
+                "multi_session": True,
+                "device_registration": True
+            },
+            "audio_config": {
+                "sample_rate": 16000,
+                "channels": 1,
+                "format": "pcm_s16le",
+                "frame_size": 320
+            },
+            "websocket_config": {
+                "endpoint": "/howdytts",
+                "protocol": "howdytts-v1",
+                "keepalive_interval": 30,
+                "max_message_size": 65536
+            },
+            "limits": {
+                "max_sessions": 10,
+                "max_audio_duration": 30,
+                "max_text_length": 1000
+            }
+        })
+        self._welcome_template = {
+            "type": "welcome",
+            "server": self.name,
+            "version": "1.0.0-test",
+            "capabilities": ["tts", "voice", "echo_test"]
+        }
+
     async def setup_http_server(self):
         """Setup HTTP server with API endpoints"""
         self.app = web.Application()
@@ -83,17 +175,13 @@ class HowdyTTSTestServer:
             )
         })
         
-        # API Routes
-        self.app.router.add_get('/health', self.health_endpoint)
-        self.app.router.add_get('/config', self.config_endpoint)
-        self.app.router.add_post('/devices/register', self.register_device_endpoint)
-        self.app.router.add_get('/devices', self.list_devices_endpoint)
-        self.app.router.add_get('/sessions', self.list_sessions_endpoint)
-        self.app.router.add_get('/howdytts', self.websocket_endpoint)
-        
-        # Add CORS to all routes
-        for route in list(self.app.router.routes()):
-            cors.add(route)
+        # API Routes (CORS-wrapped as they are registered)
+        cors.add(self.app.router.add_get('/health', self.health_endpoint))
+        cors.add(self.app.router.add_get('/config', self.config_endpoint))
+        cors.add(self.app.router.add_post('/devices/register', self.register_device_endpoint))
+        cors.add(self.app.router.add_get('/devices', self.list_devices_endpoint))
+        cors.add(self.app.router.add_get('/sessions', self.list_sessions_endpoint))
+        cors.add(self.app.router.add_get('/howdytts', self.websocket_endpoint))
         
         # Setup runner
         self.runner = web.AppRunner(self.app)
@@ -103,11 +191,13 @@ class HowdyTTSTestServer:
         
         logger.info(f"HTTP server started on port {self.port}")
     
-    def setup_mdns(self):
+    async def setup_mdns(self):
         """Setup mDNS service advertisement"""
         try:
-            self.zeroconf = Zeroconf()
-            
+            # Single AsyncZeroconf instance - registration happens in the
+            # background instead of blocking on the announce sleeps
+            self.zeroconf = AsyncZeroconf()
+
             # Service properties
             properties = {
                 b'version': b'1.0.0',
@@ -128,7 +218,7 @@ class HowdyTTSTestServer:
             )
             
             # Register service
-            self.zeroconf.register_service(self.service_info)
+            await self.zeroconf.async_register_service(self.service_info)
             logger.info(f"mDNS service registered: {self.name}._howdytts._tcp.local. on port {self.port}")
             
         except Exception as e:
@@ -138,9 +228,9 @@ class HowdyTTSTestServer:
         """HTTP health check endpoint"""
         uptime = time.time() - self.start_time
         
-        # Get system stats
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        memory = psutil.virtual_memory()
+        # Read the cached snapshot - psutil is only touched by the sampler task
+        cpu_percent = self._cpu_percent
+        memory_percent = self._memory_percent
         
         health_data = {
             "status": "healthy",
@@ -148,7 +238,7 @@ class HowdyTTSTestServer:
             "uptime_seconds": round(uptime, 2),
             "timestamp": datetime.now().isoformat(),
             "cpu_usage": cpu_percent / 100.0,  # Convert to 0.0-1.0 range
-            "memory_usage": memory.percent / 100.0,  # Convert to 0.0-1.0 range
+            "memory_usage": memory_percent / 100.0,  # Convert to 0.0-1.0 range
             "active_sessions": len(self.active_sessions),
             "registered_devices": len(self.registered_devices),
             "websocket_clients": len(self.websocket_clients),
@@ -157,42 +247,16 @@ class HowdyTTSTestServer:
             "max_concurrent_sessions": 10
         }
         
-        logger.info(f"Health check requested - CPU: {cpu_percent:.1f}%, Memory: {memory.percent:.1f}%")
-        return web.json_response(health_data)
+        logger.info(f"Health check requested - CPU: {cpu_percent:.1f}%, Memory: {memory_percent:.1f}%")
+        return fast_json_response(health_data)
     
     async def config_endpoint(self, request):
         """HTTP configuration endpoint"""
-        config_data = {
-            "server_name": self.name,
-            "version": "1.0.0-test",
-            "features": {
-                "text_to_speech": True,
-                "voice_recognition": True,
-                "websocket_streaming": True,
-                "multi_session": True,
-                "device_registration": True
-            },
-            "audio_config": {
-                "sample_rate": 16000,
-                "channels": 1,
-                "format": "pcm_s16le",
-                "frame_size": 320
-            },
-            "websocket_config": {
-                "endpoint": "/howdytts",
-                "protocol": "howdytts-v1",
-                "keepalive_interval": 30,
-                "max_message_size": 65536
-            },
-            "limits": {
-                "max_sessions": 10,
-                "max_audio_duration": 30,
-                "max_text_length": 1000
-            }
-        }
-        
         logger.info("Configuration requested")
-        return web.json_response(config_data)
+        # Cacheable so a front proxy (see tools/nginx.sample.conf) can serve
+        # it without touching Python
+        return web.Response(text=self._config_json, content_type='application/json',
+                            headers={'Cache-Control': 'public, max-age=60'})
     
     async def register_device_endpoint(self, request):
         """HTTP device registration endpoint"""
@@ -204,22 +268,24 @@ class HowdyTTSTestServer:
             device_type = data.get('device_type', 'unknown')
             
             if not device_id:
-                return web.json_response(
+                return fast_json_response(
                     {"error": "device_id is required"}, 
                     status=400
                 )
             
             # Register device
+            registered_at = datetime.now().isoformat()
             self.registered_devices[device_id] = {
                 "device_id": device_id,
                 "device_name": device_name,
                 "device_type": device_type,
                 "capabilities": capabilities.split(',') if capabilities else [],
-                "registered_at": datetime.now().isoformat(),
-                "last_seen": datetime.now().isoformat(),
+                "registered_at": registered_at,
+                "last_seen": registered_at,
                 "status": "online"
             }
-            
+            self._devices_json = None  # force /devices payload rebuild
+
             response_data = {
                 "status": "registered",
                 "device_id": device_id,
@@ -230,69 +296,103 @@ class HowdyTTSTestServer:
             }
             
             logger.info(f"Device registered: {device_id} ({device_name}) - Capabilities: {capabilities}")
-            return web.json_response(response_data)
+            return fast_json_response(response_data)
             
         except Exception as e:
             logger.error(f"Device registration failed: {e}")
-            return web.json_response(
+            return fast_json_response(
                 {"error": "Registration failed", "details": str(e)}, 
                 status=500
             )
     
     async def list_devices_endpoint(self, request):
         """List registered devices"""
-        return web.json_response({
-            "devices": list(self.registered_devices.values()),
-            "total_count": len(self.registered_devices)
-        })
+        # Serialize once per registry change, not once per request
+        if self._devices_json is None:
+            self._devices_json = json_dumps({
+                "devices": list(self.registered_devices.values()),
+                "total_count": len(self.registered_devices)
+            })
+        return web.Response(text=self._devices_json, content_type='application/json')
     
     async def list_sessions_endpoint(self, request):
         """List active sessions"""
-        return web.json_response({
+        return fast_json_response({
             "sessions": self.active_sessions,
             "total_count": len(self.active_sessions)
         })
     
+    async def _writer_loop(self, ws: WebSocketResponse, out_q: asyncio.Queue):
+        """Drain one client's outbound queue - the only place that writes to ws"""
+        while True:
+            payload = await out_q.get()
+            if isinstance(payload, bytes):
+                await ws.send_bytes(payload)
+            else:
+                await ws.send_str(payload)
+
+    def _queue_send(self, client_info: dict, payload):
+        """Queue an outbound frame for the client's writer task"""
+        try:
+            client_info['out_q'].put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning(f"Outbound queue full, dropping frame for {client_info['remote']}")
+
+    def _queue_json(self, client_info: dict, message: dict):
+        """Serialize once with json_dumps and queue - the send_json analogue
+        for the writer-queue path (hot paths may pre-serialize themselves)"""
+        self._queue_send(client_info, json_dumps(message))
+
     async def websocket_endpoint(self, request):
         """WebSocket endpoint for real-time communication"""
-        ws = web.WebSocketResponse(protocols=['howdytts-v1'])
+        ws = web.WebSocketResponse(protocols=['howdytts-v1'], max_msg_size=65536)
         await ws.prepare(request)
-        
+
+        connected_at = datetime.now().isoformat()
         client_info = {
             "remote": request.remote,
-            "connected_at": datetime.now().isoformat(),
-            "session_id": f"ws_session_{int(time.time())}_{len(self.websocket_clients)}"
+            "connected_at": connected_at,
+            "session_id": f"ws_session_{int(time.time())}_{len(self.websocket_clients)}",
+            "out_q": asyncio.Queue(maxsize=256),
+            "audio_frames": 0,
+            "audio_bytes": 0
         }
-        
-        self.websocket_clients.append(ws)
+        writer_task = asyncio.create_task(self._writer_loop(ws, client_info['out_q']))
+
+        self.websocket_clients.add(ws)
         logger.info(f"WebSocket client connected: {client_info['remote']} (Session: {client_info['session_id']})")
         
-        # Send welcome message
-        welcome_msg = {
-            "type": "welcome",
-            "session_id": client_info['session_id'],
-            "server": self.name,
-            "version": "1.0.0-test",
-            "capabilities": ["tts", "voice", "echo_test"],
-            "timestamp": datetime.now().isoformat()
-        }
-        await ws.send_str(json.dumps(welcome_msg))
+        # Send welcome message - only the dynamic fields are added here
+        welcome_msg = dict(self._welcome_template,
+                           session_id=client_info['session_id'],
+                           timestamp=connected_at)
+        self._queue_json(client_info, welcome_msg)
         
         try:
             async for msg in ws:
                 if msg.type == WSMsgType.TEXT:
                     try:
-                        data = json.loads(msg.data)
+                        data = json_loads(msg.data)
                         await self.handle_websocket_message(ws, data, client_info)
-                    except json.JSONDecodeError:
+                    except ValueError:
                         error_msg = {
                             "type": "error",
                             "error": "Invalid JSON format",
                             "timestamp": datetime.now().isoformat()
                         }
-                        await ws.send_str(json.dumps(error_msg))
+                        self._queue_json(client_info, error_msg)
                 elif msg.type == WSMsgType.BINARY:
-                    # Handle binary audio data
+                    # Clients we control may send orjson bytes as BINARY frames
+                    # to skip aiohttp's TEXT-frame UTF-8 validation; anything
+                    # that doesn't parse as a JSON object is audio data
+                    if msg.data[:1] == b'{':
+                        try:
+                            data = json_loads(msg.data)
+                        except ValueError:
+                            data = None
+                        if isinstance(data, dict):
+                            await self.handle_websocket_message(ws, data, client_info)
+                            continue
                     await self.handle_audio_data(ws, msg.data, client_info)
                 elif msg.type == WSMsgType.ERROR:
                     logger.error(f'WebSocket error: {ws.exception()}')
@@ -302,8 +402,8 @@ class HowdyTTSTestServer:
             logger.error(f"WebSocket error: {e}")
         
         finally:
-            if ws in self.websocket_clients:
-                self.websocket_clients.remove(ws)
+            writer_task.cancel()
+            self.websocket_clients.discard(ws)
             logger.info(f"WebSocket client disconnected: {client_info['remote']}")
         
         return ws
@@ -311,14 +411,15 @@ class HowdyTTSTestServer:
     async def handle_websocket_message(self, ws: WebSocketResponse, data: dict, client_info: dict):
         """Handle WebSocket JSON messages"""
         msg_type = data.get('type')
-        
+        timestamp = datetime.now().isoformat()  # one per message, shared by every response
+
         if msg_type == 'ping':
             # Respond to ping
             pong_msg = {
                 "type": "pong",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
-            await ws.send_str(json.dumps(pong_msg))
+            self._queue_json(client_info, pong_msg)
             
         elif msg_type == 'text_to_speech':
             # Handle TTS request
@@ -327,9 +428,6 @@ class HowdyTTSTestServer:
             
             logger.info(f"TTS request: '{text}' (voice: {voice})")
             
-            # Simulate TTS processing
-            await asyncio.sleep(0.5)  # Simulate processing delay
-            
             tts_response = {
                 "type": "tts_response",
                 "text": text,
@@ -338,13 +436,15 @@ class HowdyTTSTestServer:
                 "sample_rate": 16000,
                 "duration_ms": len(text) * 50,  # Rough estimate
                 "status": "completed",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
-            await ws.send_str(json.dumps(tts_response))
-            
-            # Send mock audio data (silence)
-            mock_audio = b'\x00' * 1024  # 1KB of silence
-            await ws.send_bytes(mock_audio)
+
+            # Simulate the 0.5 s processing delay via the shared dispatcher
+            # instead of parking this handler task on asyncio.sleep
+            heapq.heappush(self._pending_tts,
+                           (time.monotonic() + 0.5, next(self._tts_seq),
+                            client_info, json_dumps(tts_response)))
+            self._tts_pending_event.set()
             
         elif msg_type == 'voice_start':
             # Voice recognition session started
@@ -352,9 +452,9 @@ class HowdyTTSTestServer:
             response = {
                 "type": "voice_ready",
                 "session_id": client_info['session_id'],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
-            await ws.send_str(json.dumps(response))
+            self._queue_json(client_info, response)
             
         elif msg_type == 'voice_end':
             # Voice recognition session ended
@@ -368,53 +468,120 @@ class HowdyTTSTestServer:
                 "text": mock_text,
                 "confidence": 0.95,
                 "session_id": client_info['session_id'],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
-            await ws.send_str(json.dumps(response))
+            self._queue_json(client_info, response)
             
+        elif msg_type == 'set_ack_mode':
+            # Opt in to compact varint binary audio acks
+            client_info['binary_acks'] = data.get('mode') == 'binary'
+            response = {
+                "type": "ack_mode_set",
+                "mode": "binary" if client_info['binary_acks'] else "json",
+                "timestamp": timestamp
+            }
+            self._queue_json(client_info, response)
+
         elif msg_type == 'echo_test':
             # Echo test for debugging
             echo_response = {
                 "type": "echo_response",
                 "original_message": data,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
-            await ws.send_str(json.dumps(echo_response))
+            self._queue_json(client_info, echo_response)
             
         else:
             # Unknown message type
             error_msg = {
                 "type": "error",
                 "error": f"Unknown message type: {msg_type}",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
-            await ws.send_str(json.dumps(error_msg))
+            self._queue_json(client_info, error_msg)
     
+    # Audio frames per JSON ack (25 frames of 20 ms audio = one ack every 500 ms)
+    AUDIO_ACK_EVERY = 25
+
     async def handle_audio_data(self, ws: WebSocketResponse, audio_data: bytes, client_info: dict):
         """Handle binary audio data"""
-        logger.info(f"Received {len(audio_data)} bytes of audio data from {client_info['remote']}")
-        
-        # Simulate audio processing
-        await asyncio.sleep(0.01)  # Simulate processing delay
-        
-        # Send acknowledgment
+        client_info['audio_frames'] += 1
+        client_info['audio_bytes'] += len(audio_data)
+
+        # Ack once per batch instead of doubling the frame rate with
+        # one JSON reply per 20 ms audio frame
+        if client_info['audio_frames'] % self.AUDIO_ACK_EVERY != 0:
+            return
+
+        logger.info(f"Received {client_info['audio_bytes']} bytes "
+                    f"({client_info['audio_frames']} frames) of audio data from {client_info['remote']}")
+
+        if client_info.get('binary_acks'):
+            # Compact ack: varint(frames), varint(bytes), varint(server time ms)
+            ack = bytearray()
+            append_varint(ack, client_info['audio_frames'])
+            append_varint(ack, client_info['audio_bytes'])
+            append_varint(ack, int(time.time() * 1000))
+            self._queue_send(client_info, bytes(ack))
+            return
+
         ack_msg = {
             "type": "audio_received",
-            "bytes_received": len(audio_data),
+            "frames_received": client_info['audio_frames'],
+            "bytes_received": client_info['audio_bytes'],
             "session_id": client_info['session_id'],
             "timestamp": datetime.now().isoformat()
         }
-        await ws.send_str(json.dumps(ack_msg))
+        self._queue_json(client_info, ack_msg)
     
+    async def _tts_dispatcher(self):
+        """Flush simulated TTS responses once their processing deadline passes"""
+        while True:
+            if not self._pending_tts:
+                await self._tts_pending_event.wait()
+                self._tts_pending_event.clear()
+                continue
+
+            delay = self._pending_tts[0][0] - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            _, _, client_info, payload = heapq.heappop(self._pending_tts)
+            self._queue_send(client_info, payload)
+            # Send mock audio data (silence) right after the response
+            self._queue_send(client_info, MOCK_AUDIO_SILENCE)
+
+    async def _sample_stats(self):
+        """Refresh cached CPU/memory stats once per second"""
+        while True:
+            self._cpu_percent = psutil.cpu_percent(interval=None)
+            self._memory_percent = psutil.virtual_memory().percent
+            await asyncio.sleep(1.0)
+
     async def start(self):
-        """Start the test server"""
+        """Start the test server (server methods assume start() ran first)"""
         logger.info(f"Starting HowdyTTS Test Server: {self.name}")
-        
+
+        # Cache the loop for call_later/run_in_executor style paths
+        self._loop = asyncio.get_running_loop()
+
+        # Python 3.12+: run new tasks eagerly so handlers that never block
+        # (pong, echo, device lists) skip the scheduling round-trip
+        if hasattr(asyncio, 'eager_task_factory'):
+            self._loop.set_task_factory(asyncio.eager_task_factory)
+
         # Setup mDNS first
-        self.setup_mdns()
+        await self.setup_mdns()
         
         # Start HTTP server
         await self.setup_http_server()
+
+        # Start the system stats sampler for the health endpoint
+        self._stats_task = asyncio.create_task(self._sample_stats())
+
+        # Start the shared TTS response dispatcher
+        self._tts_task = asyncio.create_task(self._tts_dispatcher())
         
         logger.info(f"🎉 HowdyTTS Test Server ready!")
         logger.info(f"   📍 HTTP Server: http://0.0.0.0:{self.port}")
@@ -428,9 +595,18 @@ class HowdyTTSTestServer:
     async def stop(self):
         """Stop the test server"""
         logger.info("Stopping HowdyTTS Test Server...")
+
+        # Release anyone waiting on the server lifetime
+        self._stop_event.set()
+
+        # Stop the stats sampler and TTS dispatcher
+        if self._stats_task:
+            self._stats_task.cancel()
+        if self._tts_task:
+            self._tts_task.cancel()
         
         # Close WebSocket connections
-        for ws in self.websocket_clients[:]:
+        for ws in list(self.websocket_clients):
             await ws.close()
         
         # Stop HTTP server
@@ -441,8 +617,8 @@ class HowdyTTSTestServer:
         
         # Unregister mDNS service
         if self.zeroconf and self.service_info:
-            self.zeroconf.unregister_service(self.service_info)
-            self.zeroconf.close()
+            await self.zeroconf.async_unregister_service(self.service_info)
+            await self.zeroconf.async_close()
         
         logger.info("HowdyTTS Test Server stopped")
 
@@ -460,28 +636,29 @@ async def main():
     
     # Create and start server
     server = HowdyTTSTestServer(port=args.port, name=args.name)
-    
-    # Setup signal handlers
-    def signal_handler(signum, frame):
-        logger.info("Received interrupt signal, shutting down...")
-        asyncio.create_task(server.stop())
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
+
+    # Shut down cleanly on SIGINT/SIGTERM - handlers run on the loop thread,
+    # so no coroutine is spawned from a synchronous signal context
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, server._stop_event.set)
+
     try:
         await server.start()
-        
-        # Keep server running
-        while True:
-            await asyncio.sleep(1)
-            
-    except KeyboardInterrupt:
+
+        # Keep server running until a shutdown signal arrives
+        await server._stop_event.wait()
+        logger.info("Received interrupt signal, shutting down...")
         await server.stop()
+
     except Exception as e:
         logger.error(f"Server error: {e}")
         await server.stop()
 
 if __name__ == '__main__':
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # uvloop is optional - fall back to the default event loop
     asyncio.run(main())
\ No newline at end of file
@@ -18,71 +18,490 @@ Usage:
 
 import argparse
 import asyncio
+import atexit
+import hashlib
+import os
+import queue
+import aiohttp
 import websockets
+from websockets.extensions.permessage_deflate import ClientPerMessageDeflateFactory
 import json
 import base64
+import math
 import struct
 import time
 import logging
 import socket
 import subprocess
 import sys
+import zlib
+from dataclasses import dataclass, field, asdict
+from functools import wraps
+from operator import itemgetter
 from typing import Optional, Dict, List, Any
-import numpy as np
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('bidirectional_audio_validation.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+
+# orjson is optional but serializes several times faster than stdlib json;
+# it returns bytes, which websockets sends without the str -> utf-8 encode
+try:
+    import orjson
+    json_dumps_bytes = orjson.dumps
+    json_loads = orjson.loads
+
+    def json_dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode()
+    json_loads = json.loads
+
+    def json_dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# Configure logging; records go through a queue so file/console writes
+# happen on the listener thread instead of stalling the event loop mid-send
+from logging.handlers import QueueHandler, QueueListener
+
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('bidirectional_audio_validation.log')
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_log_formatter)
+
+_log_queue: queue.Queue = queue.Queue(-1)
+# Message-only format on the QueueHandler: prepare() bakes its formatter
+# into the queued record, so anything richer here would get formatted a
+# second time by the listener's handlers
+logging.basicConfig(level=logging.INFO, format='%(message)s',
+                    handlers=[QueueHandler(_log_queue)])
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
+# Performance-metric schemas: the defaults dict doubles as the key order for
+# its itemgetter, so one bound C call extracts a whole group at once after
+# defaults are merged under the device payload
+_AUDIO_DEFAULTS = dict.fromkeys((
+    'sample_rate_actual', 'bit_depth_actual', 'channel_count',
+    'audio_dropouts', 'buffer_underruns'), 0)
+_AUDIO_FIELDS = itemgetter(*_AUDIO_DEFAULTS)
+_SYSTEM_DEFAULTS = dict.fromkeys((
+    'cpu_usage_percent', 'memory_usage_percent',
+    'free_heap_bytes', 'task_high_water_mark'), 0)
+_SYSTEM_FIELDS = itemgetter(*_SYSTEM_DEFAULTS)
+_NETWORK_DEFAULTS = dict.fromkeys((
+    'packet_loss_rate', 'average_latency_ms', 'jitter_ms'), 0)
+_NETWORK_FIELDS = itemgetter(*_NETWORK_DEFAULTS)
+_ECHO_DEFAULTS = dict.fromkeys(('suppression_db', 'tail_length_ms'), 0)
+_ECHO_FIELDS = itemgetter(*_ECHO_DEFAULTS)
+
+# On-disk result cache for iterative development runs (see --use-cache)
+CACHE_DIR = os.path.expanduser('~/.cache/howdy_validate')
+
+# Validation plan: tests within a wave exercise disjoint endpoints and run
+# concurrently, while later waves depend on earlier state (conversation
+# flow needs the full-duplex setup) or deliberately destabilize the system
+# (error recovery goes last). Entries name validator methods, resolved
+# with getattr at run time, so the plan is built once at import
+_VALIDATION_WAVES = (
+    (("WebSocket TTS Handler", "validate_websocket_tts_handler"),
+     ("TTS Audio Pipeline", "validate_tts_audio_pipeline"),
+     ("Performance Metrics", "validate_performance_metrics")),
+    (("Full-Duplex I2S", "validate_full_duplex_operation"),),
+    (("Conversation Flow", "validate_conversation_flow"),),
+    (("Error Recovery", "validate_error_recovery"),),
+)
+
+# Fault-injection scenarios, tagged by subsystem so scenarios hitting
+# independent subsystems can run (and recover) concurrently
+_ERROR_SCENARIOS = (
+    {
+        "name": "WebSocket disconnection",
+        "scenario": "websocket_disconnect",
+        "subsystem": "network",
+        "duration_ms": 5000,
+        "expected_recovery_ms": 10000
+    },
+    {
+        "name": "Audio buffer overflow",
+        "scenario": "audio_buffer_overflow",
+        "subsystem": "audio",
+        "duration_ms": 3000,
+        "expected_recovery_ms": 2000
+    },
+    {
+        "name": "Network interruption",
+        "scenario": "network_interruption",
+        "subsystem": "network",
+        "duration_ms": 8000,
+        "expected_recovery_ms": 15000
+    },
+    {
+        "name": "TTS playback failure",
+        "scenario": "tts_playback_failure",
+        "subsystem": "audio",
+        "duration_ms": 2000,
+        "expected_recovery_ms": 5000
+    },
+)
+
+# Headline metrics echoed at the end of a comprehensive run: metric key,
+# log format and a multiplier applied before formatting. Adding a metric
+# to the summary is a table entry, not another if-block
+_KEY_METRIC_REPORT = (
+    ('total_conversation_latency_ms',
+     "   Total Conversation Latency: %sms (target: <7000ms)", 1),
+    ('network_latency_ms',
+     "   Network Latency: %sms (target: <50ms)", 1),
+    ('echo_suppression_db',
+     "   Echo Suppression: %sdB (target: >20dB)", 1),
+    ('recovery_success_rate',
+     "   Recovery Success Rate: %.1f%% (target: >75%%)", 100),
+)
+
+@dataclass(slots=True)
+class TestOutcome:
+    """Structured validate_* result: a plain return travels through the
+    runner's gather instead of an exception plus traceback capture, and the
+    runner never needs return_exceptions. Truthiness mirrors ok so call
+    sites can keep reading naturally"""
+    ok: bool
+    err: Optional[str] = None
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+def _enable_tcp_nodelay(ws):
+    """Disable Nagle on a connected WebSocket so small JSON control frames
+    leave immediately instead of waiting out a coalescing window (~40ms),
+    which would otherwise inflate every latency measurement"""
+    sock = ws.transport.get_extra_info('socket') if hasattr(ws, 'transport') else None
+    if sock is not None:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+def cached_test(fn):
+    """Memoize a passing validate_* outcome on disk, keyed by test name,
+    targets and firmware version, so repeat runs against unchanged firmware
+    skip the multi-second test. Only active with --use-cache; failures are
+    never cached so a fix is always retested"""
+    @wraps(fn)
+    async def wrapper(self, *args, **kwargs):
+        if not self.use_cache:
+            return await fn(self, *args, **kwargs)
+
+        key_src = f"{fn.__name__}|{self.device_ip}|{self.server_ip}|{await self._firmware_version()}"
+        cache_path = os.path.join(
+            CACHE_DIR, hashlib.sha256(key_src.encode()).hexdigest() + '.json')
+
+        try:
+            if time.time() - os.path.getmtime(cache_path) < self.cache_ttl:
+                with open(cache_path, 'rb') as f:
+                    cached = json_loads(f.read())
+                self.test_results.update(cached['test_results'])
+                self.performance_metrics.update(cached['performance_metrics'])
+                logger.info("💾 Using cached result for %s", fn.__name__)
+                return TestOutcome(**cached['result'])
+        except (OSError, KeyError, ValueError):
+            pass
+
+        results_before = set(self.test_results)
+        metrics_before = set(self.performance_metrics)
+        result = await fn(self, *args, **kwargs)
+        if result:
+            payload = {
+                'result': asdict(result),
+                'test_results': {k: v for k, v in self.test_results.items()
+                                 if k not in results_before},
+                'performance_metrics': {k: v for k, v in self.performance_metrics.items()
+                                        if k not in metrics_before}
+            }
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with open(cache_path, 'wb') as f:
+                    f.write(json_dumps_bytes(payload))
+            except OSError:
+                pass
+        return result
+    return wrapper
+
 class ESP32AudioValidator:
     """Complete ESP32-P4 bidirectional audio system validator"""
-    
-    def __init__(self, device_ip: str, server_ip: str):
+
+    # Longest test tone any validator asks for - sizes the scratch buffer
+    MAX_TONE_MS = 5000
+
+
+    def __init__(self, device_ip: str, server_ip: str, use_binary_chunks: bool = False,
+                 chunk_batch_size: int = 1, use_cache: bool = False,
+                 cache_ttl: float = 300.0, results_path: Optional[str] = None):
         self.device_ip = device_ip
         self.server_ip = server_ip
+        # When enabled, TTS chunks go out as a small JSON header plus the raw
+        # PCM in a binary frame - no base64 on either end, 25% fewer bytes on
+        # the wire. Requires the matching ESP32 TTS handler protocol support.
+        self.use_binary_chunks = use_binary_chunks
+        # Chunks per WebSocket frame; >1 batches them into a single
+        # tts_audio_chunk_batch message (also needs device-side support)
+        self.chunk_batch_size = chunk_batch_size
+        # On-disk memoization of passing results for iterative runs
+        self.use_cache = use_cache
+        self.cache_ttl = cache_ttl
+        self._firmware_version_cached: Optional[str] = None
         self.websocket_port = 8001  # VAD feedback port
         self.tts_websocket_port = 8002  # TTS WebSocket port
         self.udp_port = 8000  # Audio streaming port
+
+        # Device endpoints hit once per scenario, formatted ahead of the
+        # loop so the hot path does attribute lookups instead of repeated
+        # f-string builds (and the scheme is swappable in one place)
+        self._error_scenario_url = f"http://{device_ip}/api/test/error_scenario"
+        self._scenario_batch_url = f"http://{device_ip}/api/test/error_scenario_batch"
+        self._recovery_status_url = f"http://{device_ip}/api/status/recovery"
+        self._recovery_batch_url = f"http://{device_ip}/api/status/recovery_batch"
+        self._events_uri = f"ws://{device_ip}/events"
         
         # Test state
         self.test_results = {}
         self.performance_metrics = {}
         self.error_count = 0
+
+        # Stream per-scenario results to a JSON-lines sidecar as they
+        # complete, and fold recovery times into a Welford accumulator, so
+        # long soak runs don't have to retain every result until the final
+        # report write
+        self._results_jsonl = None
+        if results_path is not None:
+            self._results_jsonl = open(results_path + '.jsonl', 'wb')
+        self._recovery_stats = {'n': 0, 'mean': 0.0, 'm2': 0.0}
+
+        # Shared HTTP session - pooled keep-alive connections, created lazily
+        # so __init__ stays usable outside a running event loop
+        self._http: Optional[aiohttp.ClientSession] = None
         
-        # Audio test data
+        # Audio test data; one preallocated scratch buffer holds whatever
+        # tone is current, and regeneration writes into it in place instead
+        # of allocating a fresh buffer per tone. Chunking slices the view
+        # without copying (b64, crc32 and websockets all take bytes-likes)
+        self._audio_buf = bytearray(2 * 16000 * self.MAX_TONE_MS // 1000)
         self.test_audio_16khz = self._generate_test_audio()
-        
-    def _generate_test_audio(self, duration_ms: int = 2000, frequency: int = 440) -> bytes:
-        """Generate test audio for TTS playback validation"""
+        self._audio_mv = self.test_audio_16khz
+        self.test_audio_b64_chunks = self._encode_audio_chunks()
+
+    def _generate_test_audio(self, duration_ms: int = 2000, frequency: int = 440) -> memoryview:
+        """Generate test audio for TTS playback validation, written in place
+        into the shared scratch buffer; returns a zero-copy view of it"""
         sample_rate = 16000
-        samples = int(sample_rate * duration_ms / 1000)
-        
-        # Generate sine wave at specified frequency
-        t = np.linspace(0, duration_ms / 1000, samples, False)
-        audio = np.sin(2 * np.pi * frequency * t)
-        
-        # Scale to 16-bit signed integer
-        audio_16bit = (audio * 32767).astype(np.int16)
-        
-        return audio_16bit.tobytes()
+        samples = min(int(sample_rate * duration_ms / 1000),
+                      len(self._audio_buf) // 2)
+
+        # Rotate a unit phasor instead of calling sin() per sample - two
+        # multiplies and two adds each step. Pure stdlib, so the script no
+        # longer pays the NumPy import on every CLI startup for one 2s tone
+        omega = 2 * math.pi * frequency / sample_rate
+        cos_w, sin_w = math.cos(omega), math.sin(omega)
+        c, s = 1.0, 0.0
+        buf_view = memoryview(self._audio_buf)
+        samples_view = buf_view.cast('h')  # int16 view, no copy
+        for i in range(samples):
+            samples_view[i] = int(s * 32767)
+            c, s = c * cos_w - s * sin_w, s * cos_w + c * sin_w
+
+        return buf_view[:2 * samples]
+
+    def _encode_audio_chunks(self, chunk_bytes: int = 640) -> List[str]:
+        """Base64-encode the test audio once, split into the 20ms chunks the
+        TTS handler streams (640-byte chunks never align to base64's 3-byte
+        groups, so a single full-buffer encode cannot be sliced per chunk)"""
+        audio = self._audio_mv
+        return [base64.b64encode(audio[i:i + chunk_bytes]).decode('ascii')
+                for i in range(0, len(audio), chunk_bytes)]
+
+    def _build_chunk_messages(self, session_id: str, chunk_size: int = 320,
+                              total_chunks: int = 10) -> List[tuple]:
+        """Serialize every tts_audio_chunk for a session up front so the send
+        loop only awaits the socket and the pacing sleep. Each entry is
+        (frames, pace_s): the WebSocket frames for one send plus how long to
+        sleep afterwards to hold the real-time chunk cadence. Batching packs
+        several chunks per frame and sleeps their combined duration"""
+        entries = []
+        batch: List[dict] = []
+        for chunk_seq in range(total_chunks):
+            # Zero-copy view of the chunk - only the binary-frame path ever
+            # hands the actual bytes to the socket
+            chunk_audio = self._audio_mv[chunk_seq * chunk_size * 2:(chunk_seq + 1) * chunk_size * 2]
+            if len(chunk_audio) == 0:
+                chunk_audio = b'\x00\x00' * chunk_size  # Silence if no more test data
+
+            if self.use_binary_chunks:
+                header = json_dumps_bytes({
+                    "type": "tts_audio_chunk_hdr",
+                    "session_id": session_id,
+                    "chunk_sequence": chunk_seq,
+                    "chunk_size": len(chunk_audio),
+                    "is_final": (chunk_seq == total_chunks - 1),
+                    "checksum": f"{zlib.crc32(chunk_audio):08x}"
+                })
+                entries.append(((header, chunk_audio), 0.1))
+                continue
+
+            # Reuse the base64 strings encoded once at startup; only
+            # synthesized silence chunks still pay a per-chunk encode
+            if chunk_seq < len(self.test_audio_b64_chunks):
+                encoded_audio = self.test_audio_b64_chunks[chunk_seq]
+            else:
+                encoded_audio = base64.b64encode(chunk_audio).decode('ascii')
+
+            chunk_message = {
+                "type": "tts_audio_chunk",
+                "chunk_info": {
+                    "session_id": session_id,
+                    "chunk_sequence": chunk_seq,
+                    "chunk_size": len(chunk_audio),
+                    "is_final": (chunk_seq == total_chunks - 1),
+                    "audio_data": encoded_audio,
+                    "checksum": f"{zlib.crc32(chunk_audio):08x}"
+                },
+                "timing": {
+                    "chunk_start_time_ms": chunk_seq * 200,
+                    "chunk_duration_ms": 200
+                }
+            }
 
-    async def validate_websocket_tts_handler(self) -> bool:
+            if self.chunk_batch_size <= 1:
+                entries.append(((json_dumps_bytes(chunk_message),), 0.1))
+                continue
+
+            batch.append(chunk_message)
+            if len(batch) >= self.chunk_batch_size or chunk_seq == total_chunks - 1:
+                entries.append((
+                    (json_dumps_bytes({"type": "tts_audio_chunk_batch",
+                                       "session_id": session_id,
+                                       "chunks": batch}),),
+                    0.1 * len(batch)
+                ))
+                batch = []
+        return entries
+
+    async def _session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared HTTP session (aiohttp already sets
+        TCP_NODELAY on its client transports, so the small JSON POSTs are
+        never held back by Nagle)"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0, limit_per_host=16,
+                                               keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=15)
+            )
+        return self._http
+
+    async def aclose(self):
+        """Release the shared HTTP session and the results stream"""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        if self._results_jsonl is not None:
+            self._results_jsonl.close()
+            self._results_jsonl = None
+
+    def _record_scenario(self, name: str, result: dict):
+        """Stream one completed scenario to the JSONL sidecar and update the
+        running recovery-time statistics (Welford's algorithm - constant
+        memory regardless of scenario count)"""
+        if self._results_jsonl is not None:
+            self._results_jsonl.write(
+                json_dumps_bytes({'scenario': name, **result}) + b"\n")
+            self._results_jsonl.flush()
+
+        sample = result.get('recovery_time_ms')
+        if sample is None:
+            return
+        stats = self._recovery_stats
+        stats['n'] += 1
+        delta = sample - stats['mean']
+        stats['mean'] += delta / stats['n']
+        stats['m2'] += delta * (sample - stats['mean'])
+
+    async def _firmware_version(self) -> str:
+        """Fetch the device firmware version once; cache keys include it so
+        a reflash invalidates every memoized result automatically"""
+        if self._firmware_version_cached is None:
+            try:
+                status, data = await self._http_get(f"http://{self.device_ip}/version")
+                self._firmware_version_cached = data.get('version', 'unknown') if status == 200 else 'unknown'
+            except Exception:
+                self._firmware_version_cached = 'unknown'
+        return self._firmware_version_cached
+
+    async def _http_get(self, url: str) -> tuple:
+        """GET url, returning (status, parsed JSON body or None)"""
+        session = await self._session()
+        async with session.get(url) as response:
+            data = json_loads(await response.read()) if response.status == 200 else None
+            return response.status, data
+
+    async def _http_post(self, url: str, payload: dict) -> tuple:
+        """POST JSON payload to url, returning (status, parsed body or None)"""
+        session = await self._session()
+        async with session.post(url, json=payload) as response:
+            data = json_loads(await response.read()) if response.status == 200 else None
+            return response.status, data
+
+    async def _poll_status(self, url: str, done_key: str = 'done',
+                           timeout_s: float = 10.0, initial_delay: float = 0.05,
+                           max_delay: float = 1.0) -> tuple:
+        """Poll a status endpoint with exponential backoff until it reports
+        done_key truthy or timeout_s lapses, returning the last (status,
+        body). Worst case equals the old fixed sleep; a fast device exits
+        early instead of idling out the full wait"""
+        delay = initial_delay
+        deadline = time.monotonic() + timeout_s
+        while True:
+            status, data = await self._http_get(url)
+            if status == 200 and data is not None and data.get(done_key, False):
+                return status, data
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return status, data
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+
+    @cached_test
+    async def validate_websocket_tts_handler(self) -> TestOutcome:
         """Validate WebSocket TTS message handler and Base64 decoding"""
         logger.info("🔍 Validating WebSocket TTS message handler...")
         
         try:
             # Test connection to TTS WebSocket server
             uri = f"ws://{self.server_ip}:{self.tts_websocket_port}/tts"
-            
-            async with websockets.connect(uri) as websocket:
-                logger.info(f"✅ Connected to TTS WebSocket server: {uri}")
+
+            if self.use_binary_chunks:
+                # Raw PCM is effectively incompressible - skip deflate rather
+                # than paying its CPU for no wire savings
+                ws_options = {"compression": None}
+            else:
+                # The base64-in-JSON envelopes repeat keys and padding every
+                # chunk, so deflate with a small tuned window wins both ways
+                ws_options = {
+                    "compression": None,
+                    "extensions": [ClientPerMessageDeflateFactory(
+                        server_max_window_bits=12,
+                        client_max_window_bits=12,
+                        compress_settings={"memLevel": 4}
+                    )]
+                }
+
+            # The validation run lasts well under 30s, so keepalive pings are
+            # just spurious event-loop wakeups; a 1MB write limit keeps the
+            # small paced chunks from ever hitting backpressure checks
+            async with websockets.connect(uri,
+                                          ping_interval=None,
+                                          ping_timeout=None,
+                                          max_size=2**20,
+                                          write_limit=2**20,
+                                          **ws_options) as websocket:
+                _enable_tcp_nodelay(websocket)
+                logger.info("✅ Connected to TTS WebSocket server: %s", uri)
                 
                 # Test TTS audio start message
                 session_id = f"test_session_{int(time.time())}"
@@ -109,43 +528,36 @@ class ESP32AudioValidator:
                     }
                 }
                 
-                await websocket.send(json.dumps(tts_start_message))
-                logger.info(f"📤 Sent TTS audio start message for session: {session_id}")
-                
-                # Test TTS audio chunks with Base64 encoding
+                await websocket.send(json_dumps_bytes(tts_start_message))
+                logger.info("📤 Sent TTS audio start message for session: %s", session_id)
+
+                # Test TTS audio chunks with Base64 encoding; the messages
+                # are serialized up front so only the send is in the loop
                 chunk_size = 320  # 20ms at 16kHz
                 total_chunks = 10
-                
-                for chunk_seq in range(total_chunks):
-                    # Generate chunk audio data
-                    chunk_audio = self.test_audio_16khz[chunk_seq * chunk_size * 2:(chunk_seq + 1) * chunk_size * 2]
-                    if len(chunk_audio) == 0:
-                        chunk_audio = b'\x00\x00' * chunk_size  # Silence if no more test data
-                    
-                    # Base64 encode the audio data
-                    encoded_audio = base64.b64encode(chunk_audio).decode('ascii')
-                    
-                    tts_chunk_message = {
-                        "type": "tts_audio_chunk",
-                        "chunk_info": {
-                            "session_id": session_id,
-                            "chunk_sequence": chunk_seq,
-                            "chunk_size": len(chunk_audio),
-                            "is_final": (chunk_seq == total_chunks - 1),
-                            "audio_data": encoded_audio,
-                            "checksum": f"{hash(chunk_audio):08x}"
-                        },
-                        "timing": {
-                            "chunk_start_time_ms": chunk_seq * 200,
-                            "chunk_duration_ms": 200
-                        }
-                    }
-                    
-                    await websocket.send(json.dumps(tts_chunk_message))
-                    logger.info(f"📤 Sent TTS chunk {chunk_seq + 1}/{total_chunks} ({len(chunk_audio)} bytes)")
-                    
-                    # Small delay to simulate real-time streaming
-                    await asyncio.sleep(0.1)
+                chunk_messages = self._build_chunk_messages(session_id, chunk_size, total_chunks)
+
+                # Pace sends against absolute deadlines so timer slop does
+                # not accumulate across chunks; a busy loop catches up on
+                # the next send instead of compounding the lag
+                loop = asyncio.get_running_loop()
+                target = loop.time()
+                late_sends = 0
+                for send_seq, (frames, pace) in enumerate(chunk_messages):
+                    for frame in frames:
+                        await websocket.send(frame)
+                    logger.info("📤 Sent TTS frame group %d/%d (%d bytes framed)",
+                                send_seq + 1, len(chunk_messages), sum(len(f) for f in frames))
+
+                    target += pace
+                    delay = target - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    else:
+                        late_sends += 1
+                if late_sends:
+                    logger.warning("Pacing fell behind on %d/%d sends - possible backpressure",
+                                   late_sends, len(chunk_messages))
                 
                 # Test TTS audio end message
                 tts_end_message = {
@@ -164,30 +576,36 @@ class ESP32AudioValidator:
                     }
                 }
                 
-                await websocket.send(json.dumps(tts_end_message))
-                logger.info(f"📤 Sent TTS audio end message for session: {session_id}")
-                
-                # Wait for processing
-                await asyncio.sleep(2)
+                await websocket.send(json_dumps_bytes(tts_end_message))
+                logger.info("📤 Sent TTS audio end message for session: %s", session_id)
                 
+                # Wait for the device's ack instead of a fixed sleep; fall
+                # back gracefully for handlers that never send one or whose
+                # first reply frame isn't a JSON object (e.g. binary audio)
+                try:
+                    ack = json_loads(await asyncio.wait_for(websocket.recv(), timeout=5.0))
+                    logger.info("📥 Received TTS ack: %s", ack.get('type', 'unknown'))
+                except (asyncio.TimeoutError, ValueError, AttributeError):
+                    logger.warning("No TTS ack within 5s - continuing (handler may not send acks)")
+
+
                 self.test_results['websocket_tts_handler'] = True
                 logger.info("✅ WebSocket TTS message handler validation PASSED")
-                return True
+                return TestOutcome(True)
                 
         except Exception as e:
-            logger.error(f"❌ WebSocket TTS handler validation FAILED: {e}")
+            logger.error("❌ WebSocket TTS handler validation FAILED: %s", e)
             self.test_results['websocket_tts_handler'] = False
             self.error_count += 1
-            return False
+            return TestOutcome(False, str(e))
 
-    async def validate_tts_audio_pipeline(self) -> bool:
+    @cached_test
+    async def validate_tts_audio_pipeline(self) -> TestOutcome:
         """Validate TTS audio handler speaker output pipeline"""
         logger.info("🔍 Validating TTS audio handler pipeline...")
         
         try:
             # Connect to ESP32 via HTTP to trigger TTS test
-            import requests
-            
             test_url = f"http://{self.device_ip}/api/test/tts_pipeline"
             
             # Send TTS pipeline test request
@@ -201,32 +619,28 @@ class ESP32AudioValidator:
                 "test_duration_ms": 3000
             }
             
-            response = requests.post(test_url, json=test_data, timeout=10)
-            
-            if response.status_code == 200:
-                result = response.json()
+            status, result = await self._http_post(test_url, test_data)
+
+            if status == 200:
                 if result.get('status') == 'success':
                     logger.info("✅ TTS audio pipeline test initiated successfully")
                     
-                    # Wait for test completion
-                    await asyncio.sleep(5)
-                    
-                    # Check test results
+                    # Poll for test completion instead of sleeping the full
+                    # nominal test duration
                     status_url = f"http://{self.device_ip}/api/status/tts_pipeline"
-                    status_response = requests.get(status_url, timeout=5)
-                    
-                    if status_response.status_code == 200:
-                        status_data = status_response.json()
-                        
+                    status, status_data = await self._poll_status(
+                        status_url, done_key='test_complete', timeout_s=5.0)
+
+                    if status == 200:
                         # Validate key metrics
                         chunks_played = status_data.get('chunks_played', 0)
                         bytes_played = status_data.get('bytes_played', 0)
                         buffer_underruns = status_data.get('buffer_underruns', 0)
                         
-                        logger.info(f"📊 TTS Pipeline Results:")
-                        logger.info(f"   Chunks played: {chunks_played}")
-                        logger.info(f"   Bytes played: {bytes_played}")
-                        logger.info(f"   Buffer underruns: {buffer_underruns}")
+                        logger.info("📊 TTS Pipeline Results:")
+                        logger.info("   Chunks played: %s", chunks_played)
+                        logger.info("   Bytes played: %s", bytes_played)
+                        logger.info("   Buffer underruns: %s", buffer_underruns)
                         
                         # Performance criteria
                         if chunks_played > 0 and bytes_played > 0 and buffer_underruns < 2:
@@ -234,33 +648,32 @@ class ESP32AudioValidator:
                             self.performance_metrics['tts_chunks_played'] = chunks_played
                             self.performance_metrics['tts_buffer_underruns'] = buffer_underruns
                             logger.info("✅ TTS audio pipeline validation PASSED")
-                            return True
+                            return TestOutcome(True)
                         else:
-                            logger.error(f"❌ TTS pipeline performance below threshold")
-                            return False
+                            logger.error("❌ TTS pipeline performance below threshold")
+                            return TestOutcome(False)
                     else:
-                        logger.error(f"❌ Failed to get TTS pipeline status")
-                        return False
+                        logger.error("❌ Failed to get TTS pipeline status")
+                        return TestOutcome(False)
                 else:
-                    logger.error(f"❌ TTS pipeline test failed: {result.get('error')}")
-                    return False
+                    logger.error("❌ TTS pipeline test failed: %s", result.get('error'))
+                    return TestOutcome(False)
             else:
-                logger.error(f"❌ TTS pipeline test request failed: {response.status_code}")
-                return False
+                logger.error("❌ TTS pipeline test request failed: %s", status)
+                return TestOutcome(False)
                 
         except Exception as e:
-            logger.error(f"❌ TTS audio pipeline validation FAILED: {e}")
+            logger.error("❌ TTS audio pipeline validation FAILED: %s", e)
             self.test_results['tts_audio_pipeline'] = False
             self.error_count += 1
-            return False
+            return TestOutcome(False, str(e))
 
-    async def validate_full_duplex_operation(self) -> bool:
+    @cached_test
+    async def validate_full_duplex_operation(self) -> TestOutcome:
         """Validate full-duplex I2S operation with simultaneous capture and playback"""
         logger.info("🔍 Validating full-duplex I2S operation...")
         
         try:
-            import requests
-            
             # Test simultaneous I2S mode activation
             mode_url = f"http://{self.device_ip}/api/audio/i2s_mode"
             
@@ -270,35 +683,29 @@ class ESP32AudioValidator:
                 "test_duration_ms": 5000
             }
             
-            response = requests.post(mode_url, json=mode_data, timeout=10)
-            
-            if response.status_code == 200:
-                result = response.json()
-                
+            status, result = await self._http_post(mode_url, mode_data)
+
+            if status == 200:
                 if result.get('status') == 'success':
                     logger.info("✅ Simultaneous I2S mode activated")
                     
-                    # Wait for test completion
-                    await asyncio.sleep(6)
-                    
-                    # Check I2S statistics
+                    # Poll I2S statistics until the test run reports done
                     stats_url = f"http://{self.device_ip}/api/status/i2s_stats"
-                    stats_response = requests.get(stats_url, timeout=5)
-                    
-                    if stats_response.status_code == 200:
-                        stats_data = stats_response.json()
-                        
+                    status, stats_data = await self._poll_status(
+                        stats_url, done_key='test_complete', timeout_s=6.0)
+
+                    if status == 200:
                         # Validate simultaneous operation metrics
                         mic_samples = stats_data.get('mic_samples_read', 0)
                         speaker_samples = stats_data.get('speaker_samples_written', 0)
                         mic_errors = stats_data.get('mic_errors', 0)
                         speaker_errors = stats_data.get('speaker_errors', 0)
                         
-                        logger.info(f"📊 I2S Full-Duplex Results:")
-                        logger.info(f"   Mic samples read: {mic_samples}")
-                        logger.info(f"   Speaker samples written: {speaker_samples}")
-                        logger.info(f"   Mic errors: {mic_errors}")
-                        logger.info(f"   Speaker errors: {speaker_errors}")
+                        logger.info("📊 I2S Full-Duplex Results:")
+                        logger.info("   Mic samples read: %s", mic_samples)
+                        logger.info("   Speaker samples written: %s", speaker_samples)
+                        logger.info("   Mic errors: %s", mic_errors)
+                        logger.info("   Speaker errors: %s", speaker_errors)
                         
                         # Performance criteria for full-duplex
                         if (mic_samples > 50000 and speaker_samples > 10000 and 
@@ -310,33 +717,32 @@ class ESP32AudioValidator:
                             self.performance_metrics['i2s_error_rate'] = (mic_errors + speaker_errors) / (mic_samples + speaker_samples) * 100
                             
                             logger.info("✅ Full-duplex I2S operation validation PASSED")
-                            return True
+                            return TestOutcome(True)
                         else:
-                            logger.error(f"❌ Full-duplex I2S performance below threshold")
-                            return False
+                            logger.error("❌ Full-duplex I2S performance below threshold")
+                            return TestOutcome(False)
                     else:
-                        logger.error(f"❌ Failed to get I2S statistics")
-                        return False
+                        logger.error("❌ Failed to get I2S statistics")
+                        return TestOutcome(False)
                 else:
-                    logger.error(f"❌ Simultaneous I2S mode activation failed: {result.get('error')}")
-                    return False
+                    logger.error("❌ Simultaneous I2S mode activation failed: %s", result.get('error'))
+                    return TestOutcome(False)
             else:
-                logger.error(f"❌ I2S mode request failed: {response.status_code}")
-                return False
+                logger.error("❌ I2S mode request failed: %s", status)
+                return TestOutcome(False)
                 
         except Exception as e:
-            logger.error(f"❌ Full-duplex I2S validation FAILED: {e}")
+            logger.error("❌ Full-duplex I2S validation FAILED: %s", e)
             self.test_results['full_duplex_i2s'] = False
             self.error_count += 1
-            return False
+            return TestOutcome(False, str(e))
 
-    async def validate_conversation_flow(self) -> bool:
+    @cached_test
+    async def validate_conversation_flow(self) -> TestOutcome:
         """Validate complete conversation flow integration"""
         logger.info("🔍 Validating complete conversation flow...")
         
         try:
-            import requests
-            
             # Test complete conversation sequence
             conversation_url = f"http://{self.device_ip}/api/test/conversation_flow"
             
@@ -353,11 +759,9 @@ class ESP32AudioValidator:
                 "validate_echo_cancellation": True
             }
             
-            response = requests.post(conversation_url, json=conversation_test, timeout=15)
-            
-            if response.status_code == 200:
-                result = response.json()
-                
+            status, result = await self._http_post(conversation_url, conversation_test)
+
+            if status == 200:
                 if result.get('status') == 'success':
                     # Analyze conversation flow results
                     flow_results = result.get('flow_results', {})
@@ -374,16 +778,16 @@ class ESP32AudioValidator:
                     tts_latency = flow_results.get('tts_start_latency_ms', 0)
                     total_latency = flow_results.get('total_conversation_latency_ms', 0)
                     
-                    logger.info(f"📊 Conversation Flow Results:")
-                    logger.info(f"   Wake word detected: {wake_word_detected}")
-                    logger.info(f"   Speech processed: {speech_processed}")
-                    logger.info(f"   TTS played: {tts_played}")
-                    logger.info(f"   States validated: {states_validated}")
-                    logger.info(f"   Echo cancelled: {echo_cancelled}")
-                    logger.info(f"   Wake word latency: {wake_word_latency}ms")
-                    logger.info(f"   Speech latency: {speech_latency}ms")
-                    logger.info(f"   TTS start latency: {tts_latency}ms")
-                    logger.info(f"   Total latency: {total_latency}ms")
+                    logger.info("📊 Conversation Flow Results:")
+                    logger.info("   Wake word detected: %s", wake_word_detected)
+                    logger.info("   Speech processed: %s", speech_processed)
+                    logger.info("   TTS played: %s", tts_played)
+                    logger.info("   States validated: %s", states_validated)
+                    logger.info("   Echo cancelled: %s", echo_cancelled)
+                    logger.info("   Wake word latency: %sms", wake_word_latency)
+                    logger.info("   Speech latency: %sms", speech_latency)
+                    logger.info("   TTS start latency: %sms", tts_latency)
+                    logger.info("   Total latency: %sms", total_latency)
                     
                     # Validate against performance targets
                     conversation_success = (wake_word_detected and speech_processed and 
@@ -403,87 +807,74 @@ class ESP32AudioValidator:
                         self.performance_metrics['echo_cancellation_active'] = echo_cancelled
                         
                         logger.info("✅ Complete conversation flow validation PASSED")
-                        return True
+                        return TestOutcome(True)
                     else:
-                        logger.error(f"❌ Conversation flow validation failed")
-                        logger.error(f"   Success criteria: {conversation_success}")
-                        logger.error(f"   Latency acceptable: {latency_acceptable}")
-                        return False
+                        logger.error("❌ Conversation flow validation failed")
+                        logger.error("   Success criteria: %s", conversation_success)
+                        logger.error("   Latency acceptable: %s", latency_acceptable)
+                        return TestOutcome(False)
                 else:
-                    logger.error(f"❌ Conversation flow test failed: {result.get('error')}")
-                    return False
+                    logger.error("❌ Conversation flow test failed: %s", result.get('error'))
+                    return TestOutcome(False)
             else:
-                logger.error(f"❌ Conversation flow test request failed: {response.status_code}")
-                return False
+                logger.error("❌ Conversation flow test request failed: %s", status)
+                return TestOutcome(False)
                 
         except Exception as e:
-            logger.error(f"❌ Conversation flow validation FAILED: {e}")
+            logger.error("❌ Conversation flow validation FAILED: %s", e)
             self.test_results['conversation_flow'] = False
             self.error_count += 1
-            return False
+            return TestOutcome(False, str(e))
 
-    async def validate_performance_metrics(self) -> bool:
+    @cached_test
+    async def validate_performance_metrics(self) -> TestOutcome:
         """Validate performance metrics and audio quality parameters"""
         logger.info("🔍 Validating performance metrics and audio quality...")
         
         try:
-            import requests
-            
             # Get comprehensive system metrics
             metrics_url = f"http://{self.device_ip}/api/metrics/performance"
-            response = requests.get(metrics_url, timeout=10)
-            
-            if response.status_code == 200:
-                metrics = response.json()
-                
-                # Audio quality metrics
-                audio_metrics = metrics.get('audio_quality', {})
-                sample_rate_actual = audio_metrics.get('sample_rate_actual', 0)
-                bit_depth_actual = audio_metrics.get('bit_depth_actual', 0)
-                channel_count = audio_metrics.get('channel_count', 0)
-                audio_dropouts = audio_metrics.get('audio_dropouts', 0)
-                buffer_underruns = audio_metrics.get('buffer_underruns', 0)
-                
-                # System performance metrics
-                system_metrics = metrics.get('system_performance', {})
-                cpu_usage_percent = system_metrics.get('cpu_usage_percent', 0)
-                memory_usage_percent = system_metrics.get('memory_usage_percent', 0)
-                free_heap_bytes = system_metrics.get('free_heap_bytes', 0)
-                task_high_water_mark = system_metrics.get('task_high_water_mark', 0)
-                
-                # Network performance metrics
-                network_metrics = metrics.get('network_performance', {})
-                packet_loss_rate = network_metrics.get('packet_loss_rate', 0)
-                average_latency_ms = network_metrics.get('average_latency_ms', 0)
-                jitter_ms = network_metrics.get('jitter_ms', 0)
-                
-                # Echo cancellation metrics
-                echo_metrics = metrics.get('echo_cancellation', {})
-                echo_suppression_db = echo_metrics.get('suppression_db', 0)
-                echo_tail_length_ms = echo_metrics.get('tail_length_ms', 0)
+            status, metrics = await self._http_get(metrics_url)
+
+            if status == 200:
+                # Merge defaults under each group, then extract the whole
+                # group with one itemgetter call
+                (sample_rate_actual, bit_depth_actual, channel_count,
+                 audio_dropouts, buffer_underruns) = _AUDIO_FIELDS(
+                    {**_AUDIO_DEFAULTS, **metrics.get('audio_quality', {})})
+
+                (cpu_usage_percent, memory_usage_percent,
+                 free_heap_bytes, task_high_water_mark) = _SYSTEM_FIELDS(
+                    {**_SYSTEM_DEFAULTS, **metrics.get('system_performance', {})})
+
+                packet_loss_rate, average_latency_ms, jitter_ms = _NETWORK_FIELDS(
+                    {**_NETWORK_DEFAULTS, **metrics.get('network_performance', {})})
+
+                echo_suppression_db, echo_tail_length_ms = _ECHO_FIELDS(
+                    {**_ECHO_DEFAULTS, **metrics.get('echo_cancellation', {})})
                 
-                logger.info(f"📊 Performance Metrics:")
-                logger.info(f"   Audio Quality:")
-                logger.info(f"     Sample rate: {sample_rate_actual}Hz")
-                logger.info(f"     Bit depth: {bit_depth_actual}-bit")
-                logger.info(f"     Channels: {channel_count}")
-                logger.info(f"     Audio dropouts: {audio_dropouts}")
-                logger.info(f"     Buffer underruns: {buffer_underruns}")
+                logger.info("📊 Performance Metrics:")
+                logger.info("   Audio Quality:")
+                logger.info("     Sample rate: %sHz", sample_rate_actual)
+                logger.info("     Bit depth: %s-bit", bit_depth_actual)
+                logger.info("     Channels: %s", channel_count)
+                logger.info("     Audio dropouts: %s", audio_dropouts)
+                logger.info("     Buffer underruns: %s", buffer_underruns)
                 
-                logger.info(f"   System Performance:")
-                logger.info(f"     CPU usage: {cpu_usage_percent}%")
-                logger.info(f"     Memory usage: {memory_usage_percent}%")
-                logger.info(f"     Free heap: {free_heap_bytes} bytes")
-                logger.info(f"     Task water mark: {task_high_water_mark}")
+                logger.info("   System Performance:")
+                logger.info("     CPU usage: %s%%", cpu_usage_percent)
+                logger.info("     Memory usage: %s%%", memory_usage_percent)
+                logger.info("     Free heap: %s bytes", free_heap_bytes)
+                logger.info("     Task water mark: %s", task_high_water_mark)
                 
-                logger.info(f"   Network Performance:")
-                logger.info(f"     Packet loss: {packet_loss_rate}%")
-                logger.info(f"     Average latency: {average_latency_ms}ms")
-                logger.info(f"     Jitter: {jitter_ms}ms")
+                logger.info("   Network Performance:")
+                logger.info("     Packet loss: %s%%", packet_loss_rate)
+                logger.info("     Average latency: %sms", average_latency_ms)
+                logger.info("     Jitter: %sms", jitter_ms)
                 
-                logger.info(f"   Echo Cancellation:")
-                logger.info(f"     Suppression: {echo_suppression_db}dB")
-                logger.info(f"     Tail length: {echo_tail_length_ms}ms")
+                logger.info("   Echo Cancellation:")
+                logger.info("     Suppression: %sdB", echo_suppression_db)
+                logger.info("     Tail length: %sms", echo_tail_length_ms)
                 
                 # Validate against production targets
                 audio_quality_ok = (sample_rate_actual == 16000 and 
@@ -521,121 +912,210 @@ class ESP32AudioValidator:
                     })
                     
                     logger.info("✅ Performance metrics validation PASSED")
-                    return True
+                    return TestOutcome(True)
                 else:
-                    logger.error(f"❌ Performance metrics below production targets")
-                    logger.error(f"   Audio quality: {audio_quality_ok}")
-                    logger.error(f"   System performance: {system_performance_ok}")
-                    logger.error(f"   Network performance: {network_performance_ok}")
-                    logger.error(f"   Echo cancellation: {echo_cancellation_ok}")
-                    return False
+                    logger.error("❌ Performance metrics below production targets")
+                    logger.error("   Audio quality: %s", audio_quality_ok)
+                    logger.error("   System performance: %s", system_performance_ok)
+                    logger.error("   Network performance: %s", network_performance_ok)
+                    logger.error("   Echo cancellation: %s", echo_cancellation_ok)
+                    return TestOutcome(False)
             else:
-                logger.error(f"❌ Failed to get performance metrics: {response.status_code}")
-                return False
+                logger.error("❌ Failed to get performance metrics: %s", status)
+                return TestOutcome(False)
                 
         except Exception as e:
-            logger.error(f"❌ Performance metrics validation FAILED: {e}")
+            logger.error("❌ Performance metrics validation FAILED: %s", e)
             self.test_results['performance_metrics'] = False
             self.error_count += 1
-            return False
+            return TestOutcome(False, str(e))
+
+    async def _await_recovery_event(self, scenario: dict) -> tuple:
+        """Wait for the device to push its recovery transition over the
+        /events WebSocket instead of sleeping out the worst-case window.
+        Returns (waited, event): waited is False only when the stream was
+        unavailable and the caller still owes the fallback wait; event is
+        the matching payload or None if the window lapsed without one"""
+        timeout_s = scenario['expected_recovery_ms'] / 1000
+        try:
+            async with websockets.connect(self._events_uri, ping_interval=None,
+                                          open_timeout=2) as ws:
+                _enable_tcp_nodelay(ws)
+
+                deadline = time.monotonic() + timeout_s
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return True, None
+                    try:
+                        event = json_loads(await asyncio.wait_for(ws.recv(), timeout=remaining))
+                    except asyncio.TimeoutError:
+                        return True, None
+                    if (event.get('type') == 'recovery' and
+                            event.get('scenario') == scenario['scenario']):
+                        event['observed_at_ns'] = time.monotonic_ns()
+                        return True, event
+        except Exception:
+            # No /events endpoint on this firmware - caller falls back
+            return False, None
+
+    async def _run_scenario_batch(self, batch: List[dict]) -> Optional[dict]:
+        """Inject a batch of disjoint-subsystem scenarios in one round-trip
+        and demultiplex the batched response by correlation id. Returns the
+        per-scenario outcomes, or None when the firmware lacks the batched
+        endpoint so the caller can fall back to serial injection"""
+        payload = {"scenarios": [
+            {"corr_id": i, "scenario": s['scenario'], "duration_ms": s['duration_ms']}
+            for i, s in enumerate(batch)
+        ]}
+
+        status, result = await self._http_post(self._scenario_batch_url, payload)
+        if status != 200 or result is None or result.get('status') != 'success':
+            return None
+
+        # One recovery wait covers every scenario in the batch
+        await asyncio.sleep(max(s['expected_recovery_ms'] for s in batch) / 1000)
+
+        status, status_data = await self._http_get(self._recovery_batch_url)
+        if status != 200 or status_data is None:
+            return None
+
+        by_corr = {entry.get('corr_id'): entry
+                   for entry in status_data.get('results', [])}
+        outcomes = {}
+        for i, scenario in enumerate(batch):
+            entry = by_corr.get(i)
+            if entry is None:
+                return None
+            recovery_time_ms = entry.get('recovery_time_ms', 0)
+            outcomes[scenario['name']] = {
+                'recovered': entry.get('recovered', False),
+                'recovery_time_ms': recovery_time_ms,
+                'system_stable': entry.get('system_stable', False),
+                'within_expected_time': recovery_time_ms <= scenario['expected_recovery_ms']
+            }
+            self._record_scenario(scenario['name'], outcomes[scenario['name']])
+        return outcomes
+
+    async def _run_error_scenario(self, scenario: dict) -> tuple:
+        """Trigger one error scenario, wait out its expected recovery window
+        and report (name, recovery result)"""
+        logger.debug("🧪 Testing error scenario: %s", scenario['name'])
+
+        error_data = {
+            "scenario": scenario['scenario'],
+            "duration_ms": scenario['duration_ms']
+        }
+
+        status, result = await self._http_post(self._error_scenario_url, error_data)
+        if status != 200:
+            logger.error("   ❌ Error scenario request failed: %s", status)
+            self._record_scenario(scenario['name'], {'recovered': False})
+            return scenario['name'], {'recovered': False}
+        if result.get('status') != 'success':
+            logger.error("   ❌ Error scenario test failed: %s", result.get('error'))
+            self._record_scenario(scenario['name'], {'recovered': False})
+            return scenario['name'], {'recovered': False}
+
+        # Prefer the pushed recovery event - it ends the wait the moment the
+        # device recovers; firmware without /events falls back to probing
+        # the recovery endpoint with exponential backoff, capped at the
+        # expected recovery window
+        waited, _event = await self._await_recovery_event(scenario)
+        if waited:
+            status, status_data = await self._http_get(self._recovery_status_url)
+        else:
+            status, status_data = await self._poll_status(
+                self._recovery_status_url, done_key='recovered',
+                timeout_s=scenario['expected_recovery_ms'] / 1000,
+                initial_delay=0.02, max_delay=0.5)
+        if status != 200:
+            logger.error("   ❌ Failed to get recovery status")
+            self._record_scenario(scenario['name'], {'recovered': False})
+            return scenario['name'], {'recovered': False}
 
-    async def validate_error_recovery(self) -> bool:
+        recovered = status_data.get('recovered', False)
+        recovery_time_ms = status_data.get('recovery_time_ms', 0)
+        system_stable = status_data.get('system_stable', False)
+
+        # Per-scenario detail stays at debug; the aggregate summary in
+        # validate_error_recovery is the INFO-level signal
+        logger.debug("   Recovery status: %s", recovered)
+        logger.debug("   Recovery time: %sms", recovery_time_ms)
+        logger.debug("   System stable: %s", system_stable)
+
+        outcome = {
+            'recovered': recovered,
+            'recovery_time_ms': recovery_time_ms,
+            'system_stable': system_stable,
+            'within_expected_time': recovery_time_ms <= scenario['expected_recovery_ms']
+        }
+        self._record_scenario(scenario['name'], outcome)
+        return scenario['name'], outcome
+
+    @cached_test
+    async def validate_error_recovery(self) -> TestOutcome:
         """Validate error recovery and production readiness scenarios"""
         logger.info("🔍 Validating error recovery and production readiness...")
         
         try:
-            import requests
-            
-            # Test various error scenarios
-            error_scenarios = [
-                {
-                    "name": "WebSocket disconnection",
-                    "scenario": "websocket_disconnect",
-                    "duration_ms": 5000,
-                    "expected_recovery_ms": 10000
-                },
-                {
-                    "name": "Audio buffer overflow",
-                    "scenario": "audio_buffer_overflow",
-                    "duration_ms": 3000,
-                    "expected_recovery_ms": 2000
-                },
-                {
-                    "name": "Network interruption",
-                    "scenario": "network_interruption",
-                    "duration_ms": 8000,
-                    "expected_recovery_ms": 15000
-                },
-                {
-                    "name": "TTS playback failure",
-                    "scenario": "tts_playback_failure",
-                    "duration_ms": 2000,
-                    "expected_recovery_ms": 5000
-                }
+            # Scenarios that break the same subsystem stay serial, but the
+            # network-facing and audio-facing groups recover independently
+            subsystems: Dict[str, List[dict]] = {}
+            for s in _ERROR_SCENARIOS:
+                subsystems.setdefault(s['subsystem'], []).append(s)
+            scenario_groups = list(subsystems.values())
+
+            # Newer firmware exposes a batched fault-injection endpoint; pair
+            # one scenario per subsystem into a single round-trip and demux
+            # the results by correlation id (one shared recovery wait per
+            # batch instead of one per scenario)
+            batches = [
+                [group[i] for group in scenario_groups if i < len(group)]
+                for i in range(max(len(g) for g in scenario_groups))
             ]
-            
+
             recovery_results = {}
-            
-            for scenario in error_scenarios:
-                logger.info(f"🧪 Testing error scenario: {scenario['name']}")
-                
-                # Trigger error scenario
-                error_url = f"http://{self.device_ip}/api/test/error_scenario"
-                error_data = {
-                    "scenario": scenario['scenario'],
-                    "duration_ms": scenario['duration_ms']
-                }
-                
-                response = requests.post(error_url, json=error_data, timeout=15)
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    
-                    if result.get('status') == 'success':
-                        # Wait for recovery
-                        recovery_wait_time = scenario['expected_recovery_ms'] / 1000
-                        await asyncio.sleep(recovery_wait_time)
-                        
-                        # Check recovery status
-                        status_url = f"http://{self.device_ip}/api/status/recovery"
-                        status_response = requests.get(status_url, timeout=5)
-                        
-                        if status_response.status_code == 200:
-                            status_data = status_response.json()
-                            
-                            recovered = status_data.get('recovered', False)
-                            recovery_time_ms = status_data.get('recovery_time_ms', 0)
-                            system_stable = status_data.get('system_stable', False)
-                            
-                            logger.info(f"   Recovery status: {recovered}")
-                            logger.info(f"   Recovery time: {recovery_time_ms}ms")
-                            logger.info(f"   System stable: {system_stable}")
-                            
-                            recovery_results[scenario['name']] = {
-                                'recovered': recovered,
-                                'recovery_time_ms': recovery_time_ms,
-                                'system_stable': system_stable,
-                                'within_expected_time': recovery_time_ms <= scenario['expected_recovery_ms']
-                            }
-                        else:
-                            logger.error(f"   ❌ Failed to get recovery status")
-                            recovery_results[scenario['name']] = {'recovered': False}
-                    else:
-                        logger.error(f"   ❌ Error scenario test failed: {result.get('error')}")
-                        recovery_results[scenario['name']] = {'recovered': False}
-                else:
-                    logger.error(f"   ❌ Error scenario request failed: {response.status_code}")
-                    recovery_results[scenario['name']] = {'recovered': False}
-            
+            pending: List[dict] = []
+            for index, batch in enumerate(batches):
+                outcomes = await self._run_scenario_batch(batch)
+                if outcomes is None:
+                    # Only the failed batch and the untried ones fall back;
+                    # completed batches keep their outcomes so their faults
+                    # are never injected (or recorded) a second time
+                    pending = [s for b in batches[index:] for s in b]
+                    break
+                recovery_results.update(outcomes)
+
+            if pending:
+                # Serial fallback: per-subsystem groups still run
+                # concurrently (~max instead of ~sum of the expected
+                # recovery windows)
+                logger.info("   Batched fault injection unavailable, falling back to serial scenarios")
+
+                fallback_groups: Dict[str, List[dict]] = {}
+                for s in pending:
+                    fallback_groups.setdefault(s['subsystem'], []).append(s)
+
+                async def run_group(group):
+                    return [await self._run_error_scenario(s) for s in group]
+
+                for group_results in await asyncio.gather(
+                        *(run_group(g) for g in fallback_groups.values())):
+                    recovery_results.update(group_results)
+
+
             # Evaluate overall error recovery performance
-            total_scenarios = len(error_scenarios)
-            successful_recoveries = sum(1 for r in recovery_results.values() if r.get('recovered', False))
-            timely_recoveries = sum(1 for r in recovery_results.values() if r.get('within_expected_time', False))
+            total_scenarios = len(_ERROR_SCENARIOS)
+            successful_recoveries = timely_recoveries = 0
+            for r in recovery_results.values():
+                successful_recoveries += bool(r.get('recovered', False))
+                timely_recoveries += bool(r.get('within_expected_time', False))
             
-            logger.info(f"📊 Error Recovery Results:")
-            logger.info(f"   Total scenarios tested: {total_scenarios}")
-            logger.info(f"   Successful recoveries: {successful_recoveries}")
-            logger.info(f"   Timely recoveries: {timely_recoveries}")
+            logger.info("📊 Error Recovery Results:")
+            logger.info("   Total scenarios tested: %s", total_scenarios)
+            logger.info("   Successful recoveries: %s", successful_recoveries)
+            logger.info("   Timely recoveries: %s", timely_recoveries)
             
             recovery_success_rate = successful_recoveries / total_scenarios
             timely_recovery_rate = timely_recoveries / total_scenarios
@@ -645,140 +1125,177 @@ class ESP32AudioValidator:
                 self.test_results['error_recovery'] = True
                 self.performance_metrics['recovery_success_rate'] = recovery_success_rate
                 self.performance_metrics['timely_recovery_rate'] = timely_recovery_rate
-                
+
+                # Aggregates come from the running accumulator, not from a
+                # second pass over retained results
+                stats = self._recovery_stats
+                if stats['n']:
+                    self.performance_metrics['recovery_time_mean_ms'] = stats['mean']
+                if stats['n'] > 1:
+                    self.performance_metrics['recovery_time_stdev_ms'] = \
+                        math.sqrt(stats['m2'] / (stats['n'] - 1))
+
                 logger.info("✅ Error recovery validation PASSED")
-                return True
+                return TestOutcome(True)
             else:
-                logger.error(f"❌ Error recovery below production standards")
-                logger.error(f"   Success rate: {recovery_success_rate:.2f} (minimum: 0.75)")
-                logger.error(f"   Timely rate: {timely_recovery_rate:.2f} (minimum: 0.5)")
-                return False
+                logger.error("❌ Error recovery below production standards")
+                logger.error("   Success rate: %.2f (minimum: 0.75)", recovery_success_rate)
+                logger.error("   Timely rate: %.2f (minimum: 0.5)", timely_recovery_rate)
+                return TestOutcome(False)
                 
         except Exception as e:
-            logger.error(f"❌ Error recovery validation FAILED: {e}")
+            logger.error("❌ Error recovery validation FAILED: %s", e)
             self.test_results['error_recovery'] = False
             self.error_count += 1
-            return False
+            return TestOutcome(False, str(e))
 
     async def run_comprehensive_validation(self) -> Dict[str, Any]:
         """Run complete bidirectional audio streaming validation"""
         logger.info("🚀 Starting comprehensive bidirectional audio streaming validation")
-        logger.info(f"   ESP32 Device: {self.device_ip}")
-        logger.info(f"   HowdyTTS Server: {self.server_ip}")
-        
-        start_time = time.time()
-        
-        # Run all validation tests
-        validation_tests = [
-            ("WebSocket TTS Handler", self.validate_websocket_tts_handler),
-            ("TTS Audio Pipeline", self.validate_tts_audio_pipeline),
-            ("Full-Duplex I2S", self.validate_full_duplex_operation),
-            ("Conversation Flow", self.validate_conversation_flow),
-            ("Performance Metrics", self.validate_performance_metrics),
-            ("Error Recovery", self.validate_error_recovery)
-        ]
+        logger.info("   ESP32 Device: %s", self.device_ip)
+        logger.info("   HowdyTTS Server: %s", self.server_ip)
         
+        # Monotonic clock - immune to NTP slew over the multi-second run
+        start_ns = time.monotonic_ns()
+
+        total_tests = sum(len(wave) for wave in _VALIDATION_WAVES)
+
         passed_tests = 0
-        
-        for test_name, test_func in validation_tests:
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Running: {test_name}")
-            logger.info(f"{'='*60}")
-            
-            try:
-                result = await test_func()
-                if result:
-                    passed_tests += 1
-                    logger.info(f"✅ {test_name}: PASSED")
+
+        for wave in _VALIDATION_WAVES:
+            logger.info("\n%s", '='*60)
+            logger.info("Running: %s", ', '.join(name for name, _ in wave))
+            logger.info("%s", '='*60)
+
+            results = await asyncio.gather(
+                *(getattr(self, method)() for _, method in wave))
+            passed_tests += sum(1 for outcome in results if outcome.ok)
+            for (test_name, _), outcome in zip(wave, results):
+                # Validators catch internally and return structured
+                # outcomes, so nothing propagates through the gather and
+                # error_count is already maintained by the except paths
+                if outcome.ok:
+                    logger.info("✅ %s: PASSED", test_name)
+                elif outcome.err:
+                    logger.error("❌ %s: ERROR - %s", test_name, outcome.err)
                 else:
-                    logger.error(f"❌ {test_name}: FAILED")
-            except Exception as e:
-                logger.error(f"❌ {test_name}: ERROR - {e}")
-                self.error_count += 1
-        
-        total_time = time.time() - start_time
+                    logger.error("❌ %s: FAILED", test_name)
+
+        total_time = (time.monotonic_ns() - start_ns) / 1e9
         
         # Generate final report
         report = {
             "validation_summary": {
-                "total_tests": len(validation_tests),
+                "total_tests": total_tests,
                 "passed_tests": passed_tests,
-                "failed_tests": len(validation_tests) - passed_tests,
+                "failed_tests": total_tests - passed_tests,
                 "error_count": self.error_count,
-                "success_rate": passed_tests / len(validation_tests),
+                "success_rate": passed_tests / total_tests,
                 "total_time_seconds": total_time
             },
             "test_results": self.test_results,
             "performance_metrics": self.performance_metrics,
-            "production_ready": (passed_tests == len(validation_tests) and self.error_count == 0)
+            "production_ready": (passed_tests == total_tests and self.error_count == 0)
         }
         
-        logger.info(f"\n{'='*60}")
+        logger.info("\n%s", '='*60)
         logger.info("VALIDATION COMPLETE")
-        logger.info(f"{'='*60}")
-        logger.info(f"✅ Tests Passed: {passed_tests}/{len(validation_tests)}")
-        logger.info(f"❌ Tests Failed: {len(validation_tests) - passed_tests}")
-        logger.info(f"⚠️  Total Errors: {self.error_count}")
-        logger.info(f"⏱️  Total Time: {total_time:.1f}s")
-        logger.info(f"🏭 Production Ready: {report['production_ready']}")
+        logger.info("%s", '='*60)
+        logger.info("✅ Tests Passed: %s/%s", passed_tests, total_tests)
+        logger.info("❌ Tests Failed: %s", total_tests - passed_tests)
+        logger.info("⚠️  Total Errors: %s", self.error_count)
+        logger.info("⏱️  Total Time: %.1fs", total_time)
+        logger.info("🏭 Production Ready: %s", report['production_ready'])
         
-        # Key performance summary
+        # Key performance summary, driven by the module-level table
         if self.performance_metrics:
-            logger.info(f"\n📊 KEY PERFORMANCE METRICS:")
-            if 'total_conversation_latency_ms' in self.performance_metrics:
-                logger.info(f"   Total Conversation Latency: {self.performance_metrics['total_conversation_latency_ms']}ms (target: <7000ms)")
-            if 'network_latency_ms' in self.performance_metrics:
-                logger.info(f"   Network Latency: {self.performance_metrics['network_latency_ms']}ms (target: <50ms)")
-            if 'echo_suppression_db' in self.performance_metrics:
-                logger.info(f"   Echo Suppression: {self.performance_metrics['echo_suppression_db']}dB (target: >20dB)")
-            if 'recovery_success_rate' in self.performance_metrics:
-                logger.info(f"   Recovery Success Rate: {self.performance_metrics['recovery_success_rate']:.1%} (target: >75%)")
+            logger.info("\n📊 KEY PERFORMANCE METRICS:")
+            for key, fmt, scale in _KEY_METRIC_REPORT:
+                if key in self.performance_metrics:
+                    logger.info(fmt, self.performance_metrics[key] * scale)
         
         return report
 
+async def _run_comprehensive(validator: ESP32AudioValidator, args) -> Dict[str, Any]:
+    """Run the full validation suite and write its report"""
+    try:
+        report = await validator.run_comprehensive_validation()
+    finally:
+        await validator.aclose()
+
+    # Save report with the fast serializer (one bytes write, no big
+    # intermediate str)
+    with open(args.output, 'wb') as f:
+        f.write(json_dumps_pretty(report))
+    logger.info("📄 Validation report saved to: %s", args.output)
+    return report
+
+async def _run_subset(validator: ESP32AudioValidator, args) -> Dict[str, Any]:
+    """Run the individual tests - the TTS handler talks to the server while
+    full-duplex exercises the device, so both run concurrently"""
+    logger.info("Running individual validation tests...")
+    try:
+        tts_ok, duplex_ok = await asyncio.gather(
+            validator.validate_websocket_tts_handler(),
+            validator.validate_full_duplex_operation()
+        )
+        if tts_ok:
+            logger.info("✅ WebSocket TTS handler validation passed")
+        if duplex_ok:
+            logger.info("✅ Full-duplex operation validation passed")
+
+        report = {
+            "test_results": validator.test_results,
+            "performance_metrics": validator.performance_metrics
+        }
+    finally:
+        await validator.aclose()
+
+    with open(args.output, 'wb') as f:
+        f.write(json_dumps_pretty(report))
+    logger.info("📄 Validation report saved to: %s", args.output)
+    return report
+
 def main():
     parser = argparse.ArgumentParser(description='ESP32-P4 HowdyScreen Bidirectional Audio Validation')
     parser.add_argument('--device', required=True, help='ESP32-P4 device IP address')
     parser.add_argument('--server', required=True, help='HowdyTTS server IP address')
     parser.add_argument('--comprehensive-test', action='store_true', help='Run comprehensive test suite')
+    parser.add_argument('--binary-chunks', action='store_true',
+                        help='Stream TTS chunks as raw binary frames (no base64)')
+    parser.add_argument('--chunk-batch', type=int, default=1,
+                        help='TTS chunks packed per WebSocket frame (default 1)')
+    parser.add_argument('--use-cache', action='store_true',
+                        help='Reuse cached passing results for unchanged firmware')
+    parser.add_argument('--cache-ttl', type=float, default=300.0,
+                        help='Cached result lifetime in seconds (default 300)')
     parser.add_argument('--output', default='validation_report.json', help='Output report file')
-    
+
     args = parser.parse_args()
-    
+
     # Create validator instance
-    validator = ESP32AudioValidator(args.device, args.server)
-    
-    # Run validation
-    async def run_validation():
-        if args.comprehensive_test:
-            report = await validator.run_comprehensive_validation()
-        else:
-            # Run individual tests
-            report = {}
-            logger.info("Running individual validation tests...")
-            
-            if await validator.validate_websocket_tts_handler():
-                logger.info("✅ WebSocket TTS handler validation passed")
-            
-            if await validator.validate_full_duplex_operation():
-                logger.info("✅ Full-duplex operation validation passed")
-            
-            report = {
-                "test_results": validator.test_results,
-                "performance_metrics": validator.performance_metrics
-            }
-        
-        # Save report
-        import json
-        with open(args.output, 'w') as f:
-            json.dump(report, f, indent=2)
-        
-        logger.info(f"📄 Validation report saved to: {args.output}")
-        return report
+    validator = ESP32AudioValidator(args.device, args.server,
+                                    use_binary_chunks=args.binary_chunks,
+                                    chunk_batch_size=args.chunk_batch,
+                                    use_cache=args.use_cache,
+                                    cache_ttl=args.cache_ttl,
+                                    results_path=args.output)
     
+    # Pick the runner once, outside the event loop - each owns its own
+    # report assembly with no per-run branching inside
+    runner = _run_comprehensive if args.comprehensive_test else _run_subset
+
+    # uvloop's selector cuts event-loop overhead for the many short HTTP
+    # calls and concurrent scenario probes the validators make
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # uvloop is optional - fall back to the default event loop
+
     # Run the validation
     try:
-        report = asyncio.run(run_validation())
+        report = asyncio.run(runner(validator, args))
         
         if report.get('production_ready', False):
             logger.info("🎉 SYSTEM VALIDATION SUCCESSFUL - PRODUCTION READY!")
@@ -791,7 +1308,7 @@ def main():
         logger.info("🛑 Validation interrupted by user")
         sys.exit(2)
     except Exception as e:
-        logger.error(f"💥 Validation failed with error: {e}")
+        logger.error("💥 Validation failed with error: %s", e)
         sys.exit(3)
 
 if __name__ == "__main__":